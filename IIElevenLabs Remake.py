@@ -1,16 +1,28 @@
 import streamlit as st
-import speech_recognition as sr
 import google.generativeai as genai
+from google.generativeai import caching
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import diskcache
+import threading
+import asyncio
+import queue
+import re
 import io
 import base64
-from audio_recorder_streamlit import audio_recorder
-import tempfile
 import os
+from audio_recorder_streamlit import audio_recorder
 from pathlib import Path
 import json
+import orjson
+import ijson
+import hashlib
+import uuid
 import time
-from typing import List, Dict
+import datetime
+from typing import List, Dict, TypedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 
 # Configure page
 st.set_page_config(
@@ -28,11 +40,115 @@ if 'cloned_voices' not in st.session_state:
     st.session_state.cloned_voices = []
 if 'reader_audio' not in st.session_state:
     st.session_state.reader_audio = None
+if 'reader_audio_key' not in st.session_state:
+    st.session_state.reader_audio_key = None
+if 'gemini_cache' not in st.session_state:
+    st.session_state.gemini_cache = None
 
 # Default API keys (you can modify these)
 DEFAULT_ELEVENLABS_KEY = ""
 DEFAULT_GEMINI_KEY = ""
 
+# Number of reader chunks synthesized in parallel
+READER_MAX_WORKERS = 8
+
+# Reader chunks are fetched as 16-bit mono PCM and encoded to MP3 once
+READER_SAMPLE_RATE = 22050
+READER_PCM_FORMAT = f"pcm_{READER_SAMPLE_RATE}"
+
+# Local faster-whisper model used for speech recognition
+ASR_MODEL = "small.en"
+
+# Voice cloning upload endpoint, which gets its own retry-free adapter
+VOICE_CLONE_URL = "https://api.elevenlabs.io/v1/voices/add"
+
+@st.cache_resource
+def get_http_session():
+    """Create the shared HTTP session so ElevenLabs calls reuse pooled keep-alive connections"""
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            # Only 429s and failed connects are retried: a POST that may have
+            # reached ElevenLabs is never resent, so synthesis is not billed twice
+            max_retries=Retry(
+                total=3,
+                connect=3,
+                read=0,
+                backoff_factor=0.5,
+                status_forcelist=[429],
+                allowed_methods=frozenset(["GET", "POST"]),
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+        )
+    )
+    # The clone upload streams its body once, so a retry would resend an empty body
+    session.mount(VOICE_CLONE_URL, HTTPAdapter(max_retries=0))
+    return session
+
+@st.cache_resource
+def get_tts_cache():
+    """Open the on-disk cache of synthesized MP3 audio keyed by (voice_id, model_id, text)"""
+    return diskcache.Cache(str(Path.home() / ".cache" / "iielevenlabs" / "tts"))
+
+# Cached resources survive Streamlit reruns, unlike plain module globals
+SESSION = get_http_session()
+TTS_CACHE = get_tts_cache()
+TTS_CACHE_EXPIRE = 7 * 86400
+
+# Local sidecar that serves cached audio so the browser fetches it by URL.
+# Browsers reach it through AUDIO_SERVER_URL when set; otherwise only browsers on
+# this machine use it and everyone else gets the audio inline through Streamlit.
+AUDIO_SERVER_HOST = os.environ.get("AUDIO_SERVER_HOST", "127.0.0.1")
+AUDIO_SERVER_PORT = int(os.environ.get("AUDIO_SERVER_PORT", "8765"))
+AUDIO_SERVER_URL = os.environ.get("AUDIO_SERVER_URL", "")
+AUDIO_SERVER_START_TIMEOUT = 2.0
+LIVE_AUDIO_KEEP = 16  # Finished live streams kept in memory for replay and seeking
+
+# Speculative synthesis of likely upcoming TTS requests
+PREVIEW_TEXT = "Hello! This is how I sound. How can I help you today?"
+PREFETCH_QUEUE_SIZE = 4
+PREFETCH_FOLLOWUPS = 3
+PREVIEW_MAX_WORKERS = 4
+
+# Semantic cache of Gemini responses keyed by prompt embeddings
+SEMANTIC_CACHE_DIR = Path.home() / ".cache" / "iielevenlabs" / "semantic"
+SEMANTIC_CACHE_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+SEMANTIC_CACHE_DIM = 384
+SEMANTIC_CACHE_THRESHOLD = 0.9
+SEMANTIC_CACHE_MAX_ENTRIES = 5000
+SEMANTIC_CACHE_PERSIST_DELAY = 5.0
+
+# Gemini explicit context caching for the system prompt and conversation history
+GEMINI_CACHE_TTL = datetime.timedelta(minutes=10)
+GEMINI_CACHE_MIN_CHARS = 4096  # Characters, about the 1024 tokens Gemini needs to create a cache
+GEMINI_CACHE_MAX_TAIL = 2  # Newer exchanges sent uncached before the cache is rebuilt
+
+SYSTEM_PROMPTS = {
+    "conversational": "You are a helpful AI assistant. Provide natural, conversational responses.",
+    "dubbing": "You are a dubbing director. Help with voice acting, timing, and dubbing suggestions.",
+    "voice_cloning": "You are a voice technology expert. Provide guidance on voice cloning and synthesis.",
+    "reader": "You are a professional narrator. Format text for optimal reading and provide reading suggestions."
+}
+
+# Number of recent exchanges sent to Gemini as conversation context
+HISTORY_WINDOW = 5
+
+# Prompt templates per mode, used when there is conversation history to include
+PROMPT_TEMPLATES = {
+    mode: prefix + "\n\nPrevious conversation:\n{history}\n\nCurrent question:\n{prompt}"
+    for mode, prefix in SYSTEM_PROMPTS.items()
+}
+
+# Sentence boundaries used to hand streamed LLM text over to speech synthesis
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+')
+
+# Runs of non-whitespace counted as words in the reader
+WORD = re.compile(r'\S+')
+
 def setup_apis():
     """Setup API keys and configurations"""
     st.sidebar.title("🔧 Configuration")
@@ -54,101 +170,416 @@ def setup_apis():
 
     return gemini_api_key, elevenlabs_api_key
 
+@st.cache_data(ttl=600, show_spinner=False)
+def fetch_voices(api_key):
+    """Fetch the voice list from ElevenLabs, raising on failure so errors are not cached"""
+    url = "https://api.elevenlabs.io/v1/voices"
+    headers = {"xi-api-key": api_key}
+
+    with SESSION.get(url, headers=headers, stream=True) as response:
+        if response.status_code != 200:
+            raise RuntimeError(f"ElevenLabs API error: {response.status_code} - {response.text}")
+
+        # Parse voices incrementally, keeping only the name and id of each
+        response.raw.decode_content = True
+        voices = {}
+        for voice in ijson.items(response.raw, 'voices.item'):
+            voices[voice['name']] = voice['voice_id']
+        return voices
+
 def get_available_voices(api_key):
     """Get all available voices from ElevenLabs"""
     try:
-        url = "https://api.elevenlabs.io/v1/voices"
-        headers = {"xi-api-key": api_key}
-
-        response = requests.get(url, headers=headers)
-        if response.status_code == 200:
-            voices_data = response.json()
-            voices = {}
-            for voice in voices_data.get('voices', []):
-                voices[voice['name']] = voice['voice_id']
-            return voices
-        return {}
+        return fetch_voices(api_key)
     except Exception as e:
         st.error(f"Error fetching voices: {str(e)}")
         return {}
 
 def initialize_gemini(api_key):
-    """Initialize Gemini AI with 2.0 Flash model"""
+    """Initialize Gemini AI with 2.5 Flash model"""
     if api_key:
         genai.configure(api_key=api_key)
-        model = genai.GenerativeModel('gemini-2.0-flash-exp')
+        model = genai.GenerativeModel('gemini-2.5-flash')
         return model
     return None
 
-def speech_to_text(audio_bytes):
-    """Convert speech to text using SpeechRecognition"""
-    try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.wav') as tmp_file:
-            tmp_file.write(audio_bytes)
-            tmp_file_path = tmp_file.name
+@st.cache_resource(show_spinner=False)
+def load_asr_model():
+    """Load the faster-whisper speech recognition model"""
+    from faster_whisper import WhisperModel
 
-        r = sr.Recognizer()
-        with sr.AudioFile(tmp_file_path) as source:
-            audio_data = r.record(source)
+    return WhisperModel(ASR_MODEL, device="auto", compute_type="int8")
 
-        text = r.recognize_google(audio_data)
-        os.unlink(tmp_file_path)
-        return text
+def speech_to_text(audio_bytes):
+    """Convert speech to text using faster-whisper"""
+    try:
+        segments, _ = load_asr_model().transcribe(io.BytesIO(audio_bytes), beam_size=1, vad_filter=True)
+        text = " ".join(segment.text.strip() for segment in segments)
+        return text or None
     except Exception as e:
         st.error(f"Speech recognition error: {str(e)}")
         return None
 
-def get_gemini_response(model, prompt, conversation_history, mode="conversational"):
-    """Get response from Gemini AI with different modes"""
+@st.cache_resource(show_spinner=False)
+def load_semantic_cache():
+    """Load the prompt embedder and the persisted responses, indexed per history context"""
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+
+    SEMANTIC_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    vectors_path = SEMANTIC_CACHE_DIR / "vectors.npy"
+    entries_path = SEMANTIC_CACHE_DIR / "entries.json"
+
+    cache = {
+        "embedder": SentenceTransformer(SEMANTIC_CACHE_MODEL),
+        "contexts": {},
+        "size": 0,
+        "lock": threading.Lock(),
+        "dirty": threading.Event()
+    }
+
+    if vectors_path.exists() and entries_path.exists():
+        vectors = np.load(vectors_path)
+        entries = json.loads(entries_path.read_text())
+        # The files are replaced one after the other; skip a pair torn by a crash
+        if len(vectors) == len(entries):
+            for vec, entry in zip(vectors, entries):
+                _semantic_cache_add(cache, vec[None, :], entry["context"], entry["response"])
+
+    threading.Thread(target=_persist_semantic_cache, args=(cache,), daemon=True).start()
+    return cache
+
+def _semantic_cache_context(conversation_history):
+    """Fingerprint the history window that is sent to Gemini along with a prompt"""
+    history = "\n".join(
+        f"Human: {exchange['human']}\nAI: {exchange['ai']}" for exchange in conversation_history[-HISTORY_WINDOW:]
+    )
+    return hashlib.sha256(history.encode()).hexdigest()
+
+def _semantic_cache_add(cache, vec, context, response):
+    """Add an entry to its context's index, evicting the least recently stored contexts"""
+    import faiss
+
+    # Each history context has its own index, so other conversations never crowd it out
+    partition = cache["contexts"].pop(context, None)
+    if partition is None:
+        partition = {"index": faiss.IndexFlatIP(SEMANTIC_CACHE_DIM), "responses": []}
+    cache["contexts"][context] = partition
+
+    partition["index"].add(vec)
+    partition["responses"].append(response)
+    cache["size"] += 1
+
+    while cache["size"] > SEMANTIC_CACHE_MAX_ENTRIES:
+        oldest = next(iter(cache["contexts"]))
+        cache["size"] -= len(cache["contexts"].pop(oldest)["responses"])
+
+def _semantic_cache_search(cache, vec, context, k):
+    """Return (score, response) pairs of the closest prompts cached in the same context"""
+    with cache["lock"]:
+        partition = cache["contexts"].get(context)
+        if partition is None:
+            return []
+        scores, ids = partition["index"].search(vec, min(k, partition["index"].ntotal))
+        return [(score, partition["responses"][i]) for score, i in zip(scores[0], ids[0]) if i >= 0]
+
+def _persist_semantic_cache(cache):
+    """Write the semantic cache to disk in the background, batching stores that arrive together"""
+    import numpy as np
+
+    while True:
+        cache["dirty"].wait()
+        time.sleep(SEMANTIC_CACHE_PERSIST_DELAY)
+        cache["dirty"].clear()
+
+        try:
+            with cache["lock"]:
+                vectors = []
+                entries = []
+                for context, partition in cache["contexts"].items():
+                    vectors.append(partition["index"].reconstruct_n(0, partition["index"].ntotal))
+                    entries.extend({"context": context, "response": response} for response in partition["responses"])
+
+            vectors_tmp = SEMANTIC_CACHE_DIR / "vectors.npy.tmp"
+            entries_tmp = SEMANTIC_CACHE_DIR / "entries.json.tmp"
+            with open(vectors_tmp, "wb") as f:
+                np.save(f, np.vstack(vectors) if vectors else np.empty((0, SEMANTIC_CACHE_DIM), dtype="float32"))
+            entries_tmp.write_text(json.dumps(entries))
+            os.replace(vectors_tmp, SEMANTIC_CACHE_DIR / "vectors.npy")
+            os.replace(entries_tmp, SEMANTIC_CACHE_DIR / "entries.json")
+        except Exception:
+            pass  # The next store retries; the in-memory cache is unaffected
+
+def semantic_cache_lookup(prompt, mode, conversation_history):
+    """Return the prompt embedding and a cached response for a similar prompt, if any
+
+    Only conversational prompts are cached, and a hit also needs the same history
+    window, so follow-ups like "tell me more" never pick up another conversation's
+    answer. The embedding is None when the prompt is not cacheable or the cache
+    cannot be loaded; callers then go straight to Gemini.
+    """
+    if mode != "conversational":
+        return None, None
+
+    try:
+        cache = load_semantic_cache()
+        vec = cache["embedder"].encode([prompt], normalize_embeddings=True)
+        context = _semantic_cache_context(conversation_history)
+        for score, response in _semantic_cache_search(cache, vec, context, 1):
+            if score >= SEMANTIC_CACHE_THRESHOLD:
+                return vec, response
+        return vec, None
+    except Exception:
+        return None, None
+
+def semantic_cache_store(vec, conversation_history, response):
+    """Add a conversational prompt embedding and its response to the semantic cache
+
+    Prompts that already have a near-duplicate in the same context are skipped,
+    and the cache is written to disk later by its persist thread.
+    """
+    if vec is None:
+        return
+
     try:
-        system_prompts = {
-            "conversational": "You are a helpful AI assistant. Provide natural, conversational responses.",
-            "dubbing": "You are a dubbing director. Help with voice acting, timing, and dubbing suggestions.",
-            "voice_cloning": "You are a voice technology expert. Provide guidance on voice cloning and synthesis.",
-            "reader": "You are a professional narrator. Format text for optimal reading and provide reading suggestions."
+        cache = load_semantic_cache()
+        context = _semantic_cache_context(conversation_history)
+
+        with cache["lock"]:
+            partition = cache["contexts"].get(context)
+            if partition is not None:
+                scores, _ = partition["index"].search(vec, 1)
+                if scores[0][0] >= SEMANTIC_CACHE_THRESHOLD:
+                    return
+            _semantic_cache_add(cache, vec, context, response)
+
+        cache["dirty"].set()
+    except Exception:
+        pass  # The cache is an optimization; the response was already produced
+
+def semantic_cache_followups(conversation_history, k=PREFETCH_FOLLOWUPS):
+    """Return the latest responses cached in the context the next turn will be asked in"""
+    cache = load_semantic_cache()
+    context = _semantic_cache_context(conversation_history)
+    with cache["lock"]:
+        partition = cache["contexts"].get(context)
+        return list(partition["responses"][-k:]) if partition else []
+
+def _history_contents(conversation_history):
+    """Convert conversation history into Gemini chat contents"""
+    contents = []
+    for exchange in conversation_history:
+        contents.append({"role": "user", "parts": [exchange['human']]})
+        contents.append({"role": "model", "parts": [exchange['ai']]})
+    return contents
+
+def clear_gemini_cache():
+    """Delete the session's Gemini context cache so it stops accruing storage"""
+    cached_state = st.session_state.get('gemini_cache')
+    st.session_state.gemini_cache = None
+    if cached_state:
+        try:
+            cached_state['content'].delete()
+        except Exception:
+            pass  # Already expired or deleted on the server
+
+def get_cached_history_model(model, system_prompt, conversation_history):
+    """Get a model backed by a Gemini context cache of the system prompt and recent history
+
+    The cache holds the history window as it was when the cache was built. It is
+    reused, with its TTL extended, while at most GEMINI_CACHE_MAX_TAIL newer
+    exchanges have to be sent alongside it, then rebuilt on the current window.
+    """
+    cached_state = st.session_state.get('gemini_cache')
+    cached = None
+
+    if (cached_state
+            and cached_state['system_prompt'] == system_prompt
+            and 0 <= len(conversation_history) - cached_state['exchanges'] <= GEMINI_CACHE_MAX_TAIL):
+        try:
+            cached_state['content'].update(ttl=GEMINI_CACHE_TTL)
+            cached = cached_state['content']
+        except Exception:
+            pass  # Expired or deleted on the server; build a new one below
+
+    if cached is None:
+        clear_gemini_cache()
+        cached = caching.CachedContent.create(
+            model=model.model_name,
+            system_instruction=system_prompt,
+            contents=_history_contents(conversation_history[-HISTORY_WINDOW:]),
+            ttl=GEMINI_CACHE_TTL
+        )
+        cached_state = {
+            'content': cached,
+            'system_prompt': system_prompt,
+            'exchanges': len(conversation_history)
         }
+        st.session_state.gemini_cache = cached_state
+
+    return genai.GenerativeModel.from_cached_content(cached_content=cached), cached_state['exchanges']
+
+def cached_history_request(model, prompt, conversation_history, mode="conversational"):
+    """Get a context-cached model and the contents to send, or None to send the full prompt"""
+    system_prompt = SYSTEM_PROMPTS.get(mode, SYSTEM_PROMPTS["conversational"])
+
+    history_size = len(system_prompt) + sum(
+        len(exchange['human']) + len(exchange['ai']) for exchange in conversation_history[-HISTORY_WINDOW:]
+    )
+    if history_size < GEMINI_CACHE_MIN_CHARS:
+        # The window has shrunk below the cacheable size, so the old cache is no use
+        clear_gemini_cache()
+        return None
+
+    try:
+        cached_model, cached_exchanges = get_cached_history_model(model, system_prompt, conversation_history)
+    except Exception:
+        # Fall back to sending the full prompt when the context cache cannot be created
+        clear_gemini_cache()
+        return None
+
+    contents = _history_contents(conversation_history[cached_exchanges:])
+    contents.append({"role": "user", "parts": [prompt]})
+    return cached_model, contents
 
-        context = system_prompts.get(mode, system_prompts["conversational"]) + "\n\n"
+def build_gemini_prompt(prompt, conversation_history, mode="conversational"):
+    """Build the full Gemini prompt from the mode, recent history and question"""
+    if mode not in SYSTEM_PROMPTS:
+        mode = "conversational"
 
-        if conversation_history:
-            context += "Previous conversation:\n"
-            for exchange in conversation_history[-5:]:
-                context += f"Human: {exchange['human']}\nAI: {exchange['ai']}\n"
-            context += "\nCurrent question:\n"
+    if not conversation_history:
+        return SYSTEM_PROMPTS[mode] + "\n\n" + prompt
 
-        full_prompt = context + prompt
-        response = model.generate_content(full_prompt)
+    history = "\n".join(
+        f"Human: {exchange['human']}\nAI: {exchange['ai']}" for exchange in conversation_history[-HISTORY_WINDOW:]
+    )
+    return PROMPT_TEMPLATES[mode].format(history=history, prompt=prompt)
+
+def get_gemini_response(model, prompt, conversation_history, mode="conversational", generation_config=None):
+    """Get response from Gemini AI with different modes"""
+    try:
+        vec, cached_response = semantic_cache_lookup(prompt, mode, conversation_history)
+        if cached_response is not None:
+            return cached_response
+
+        cached_request = cached_history_request(model, prompt, conversation_history, mode)
+        if cached_request:
+            cached_model, contents = cached_request
+            response = cached_model.generate_content(contents, generation_config=generation_config)
+            semantic_cache_store(vec, conversation_history, response.text)
+            return response.text
+
+        full_prompt = build_gemini_prompt(prompt, conversation_history, mode)
+        response = model.generate_content(full_prompt, generation_config=generation_config)
+        semantic_cache_store(vec, conversation_history, response.text)
         return response.text
     except Exception as e:
         st.error(f"Gemini AI error: {str(e)}")
         return None
 
-def text_to_speech(text, api_key, voice_id, model_id="eleven_monolingual_v1"):
-    """Convert text to speech using ElevenLabs"""
-    try:
-        url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
+class ReadingAnalysis(TypedDict):
+    summary: str
+    tips: str
+
+def get_reading_analysis(model, text):
+    """Get a summary and reading tips for a text in a single structured Gemini call"""
+    analysis = get_gemini_response(
+        model,
+        f"Provide reading tips and summary for this text: {text}...",
+        [],
+        "reader",
+        generation_config=genai.GenerationConfig(
+            response_mime_type="application/json",
+            response_schema=ReadingAnalysis
+        )
+    )
+    if not analysis:
+        return None
 
-        headers = {
-            "Accept": "audio/mpeg",
-            "Content-Type": "application/json",
-            "xi-api-key": api_key
+    try:
+        return orjson.loads(analysis)
+    except orjson.JSONDecodeError:
+        return {"summary": "", "tips": analysis}
+
+def _tts_request(text, api_key, voice_id, model_id, stream=False, output_format=None):
+    """Send a text-to-speech request to ElevenLabs"""
+    url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
+    if stream:
+        url += "/stream"
+
+    headers = {
+        "Content-Type": "application/json",
+        "xi-api-key": api_key
+    }
+    if not output_format:
+        # An explicit output_format picks the encoding; otherwise ElevenLabs returns MP3
+        headers["Accept"] = "audio/mpeg"
+
+    data = {
+        "text": text,
+        "model_id": model_id,
+        "voice_settings": {
+            "stability": 0.5,
+            "similarity_boost": 0.75,
+            "style": 0.0,
+            "use_speaker_boost": True
         }
+    }
 
-        data = {
-            "text": text,
-            "model_id": model_id,
-            "voice_settings": {
-                "stability": 0.5,
-                "similarity_boost": 0.75,
-                "style": 0.0,
-                "use_speaker_boost": True
-            }
-        }
+    params = {"output_format": output_format} if output_format else None
+
+    return SESSION.post(url, params=params, data=orjson.dumps(data), headers=headers, stream=stream)
+
+def _tts_cache_key(text, voice_id, model_id, output_format=None):
+    """Build the TTS cache key for a (voice_id, model_id, text) tuple"""
+    key = f"{voice_id}|{model_id}|{text}"
+    if output_format:
+        key += f"|{output_format}"
+    return hashlib.sha256(key.encode()).hexdigest()
+
+def _cache_audio_stream(audio_chunks, key):
+    """Yield streamed audio chunks and store the full audio once complete"""
+    buffer = io.BytesIO()
+    for chunk in audio_chunks:
+        buffer.write(chunk)
+        yield chunk
+    TTS_CACHE.set(key, buffer.getvalue(), expire=TTS_CACHE_EXPIRE)
 
-        response = requests.post(url, json=data, headers=headers)
+def _fetch_speech(text, api_key, voice_id, model_id="eleven_monolingual_v1", output_format=None):
+    """Get speech from the TTS cache or ElevenLabs, raising on API errors"""
+    key = _tts_cache_key(text, voice_id, model_id, output_format)
+    cached_audio = TTS_CACHE.get(key)
+    if cached_audio is not None:
+        return cached_audio
+
+    response = _tts_request(text, api_key, voice_id, model_id, output_format=output_format)
+
+    if response.status_code != 200:
+        raise RuntimeError(f"ElevenLabs API error: {response.status_code} - {response.text}")
+
+    TTS_CACHE.set(key, response.content, expire=TTS_CACHE_EXPIRE)
+    return response.content
+
+def text_to_speech(text, api_key, voice_id, model_id="eleven_monolingual_v1", output_format=None):
+    """Convert text to speech using ElevenLabs"""
+    try:
+        return _fetch_speech(text, api_key, voice_id, model_id, output_format)
+    except Exception as e:
+        st.error(f"Text-to-speech error: {str(e)}")
+        return None
+
+def stream_text_to_speech(text, api_key, voice_id, model_id="eleven_monolingual_v1"):
+    """Stream text to speech from ElevenLabs, yielding MP3 chunks as they arrive"""
+    try:
+        key = _tts_cache_key(text, voice_id, model_id)
+        cached_audio = TTS_CACHE.get(key)
+        if cached_audio is not None:
+            return iter([cached_audio])
+
+        response = _tts_request(text, api_key, voice_id, model_id, stream=True)
 
         if response.status_code == 200:
-            return response.content
+            return _cache_audio_stream(response.iter_content(chunk_size=4096), key)
         else:
             st.error(f"ElevenLabs API error: {response.status_code} - {response.text}")
             return None
@@ -157,26 +588,421 @@ def text_to_speech(text, api_key, voice_id, model_id="eleven_monolingual_v1"):
         st.error(f"Text-to-speech error: {str(e)}")
         return None
 
-def clone_voice(api_key, voice_name, audio_files):
-    """Clone a voice using ElevenLabs Voice Cloning"""
+@st.cache_resource
+def get_live_audio():
+    """Registry of streamed audio the sidecar serves as it arrives and keeps briefly once finished"""
+    return {"streams": {}, "lock": threading.Lock()}
+
+def _follow_live_audio(entry):
+    """Yield the chunks of a live audio stream, waiting for new ones until it completes"""
+    index = 0
+    while True:
+        with entry["cond"]:
+            while index >= len(entry["chunks"]) and not entry["done"]:
+                entry["cond"].wait()
+            new_chunks = entry["chunks"][index:]
+            index += len(new_chunks)
+            finished = entry["done"] and index == len(entry["chunks"])
+        yield from new_chunks
+        if finished:
+            return
+
+@st.cache_resource
+def start_audio_server():
+    """Start the sidecar HTTP server that serves audio from the TTS cache, or None if it fails"""
+    try:
+        from fastapi import FastAPI, HTTPException, Request, Response
+        from fastapi.responses import StreamingResponse
+        import uvicorn
+    except ImportError:
+        return None
+
+    app = FastAPI()
+    live = get_live_audio()
+
+    @app.get("/audio/{key}.mp3")
+    def get_audio(key: str, request: Request):
+        audio = TTS_CACHE.get(key)
+        if audio is None:
+            with live["lock"]:
+                entry = live["streams"].get(key)
+            if entry is None:
+                raise HTTPException(status_code=404)
+            with entry["cond"]:
+                audio = entry["audio"]
+            if audio is None:
+                # Still synthesizing: stream what has arrived so playback can start now
+                return StreamingResponse(
+                    _follow_live_audio(entry),
+                    media_type="audio/mpeg",
+                    headers={"Cache-Control": "no-store"}
+                )
+
+        size = len(audio)
+        headers = {
+            "Accept-Ranges": "bytes",
+            "Cache-Control": f"public, max-age={TTS_CACHE_EXPIRE}, immutable"
+        }
+
+        # Serve byte ranges so the browser can seek without refetching the file
+        match = re.fullmatch(r"bytes=(\d*)-(\d*)", request.headers.get("range", ""))
+        if match and any(match.groups()):
+            first, last = match.groups()
+            if first:
+                start, end = int(first), min(int(last), size - 1) if last else size - 1
+            else:
+                start, end = max(size - int(last), 0), size - 1
+            if start > end:
+                return Response(status_code=416, headers={"Content-Range": f"bytes */{size}"})
+            headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+            return Response(audio[start:end + 1], status_code=206, media_type="audio/mpeg", headers=headers)
+
+        return Response(audio, media_type="audio/mpeg", headers=headers)
+
+    server = uvicorn.Server(uvicorn.Config(
+        app, host=AUDIO_SERVER_HOST, port=AUDIO_SERVER_PORT, log_level="warning"
+    ))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+
+    # uvicorn exits inside the thread when it cannot bind, e.g. when the port is taken
+    deadline = time.monotonic() + AUDIO_SERVER_START_TIMEOUT
+    while not server.started and thread.is_alive() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    return server if server.started else None
+
+def _audio_base_url():
+    """Get the sidecar base URL reachable from the current browser, if any"""
+    if AUDIO_SERVER_URL:
+        return AUDIO_SERVER_URL.rstrip("/")
+
+    host = st.context.headers.get("Host", "").rsplit(":", 1)[0]
+    if host in ("localhost", "127.0.0.1"):
+        return f"http://{host}:{AUDIO_SERVER_PORT}"
+    return None
+
+def audio_url(audio, key=None):
+    """Store audio in the TTS cache and return the sidecar URL that serves it, or None"""
+    base_url = _audio_base_url()
+    if base_url is None or start_audio_server() is None:
+        return None
+
+    key = key or hashlib.sha256(audio).hexdigest()
+    if key not in TTS_CACHE:
+        TTS_CACHE.set(key, audio, expire=TTS_CACHE_EXPIRE)
+    return f"{base_url}/audio/{key}.mp3"
+
+def live_audio_url(audio_chunks, key):
+    """Serve audio chunks from the sidecar while they are still arriving, or return None
+
+    The audio is kept in the live registry rather than the TTS cache; callers
+    whose audio belongs in the TTS cache store it there themselves.
+    """
+    base_url = _audio_base_url()
+    if base_url is None or start_audio_server() is None:
+        return None
+
+    if key not in TTS_CACHE:
+        live = get_live_audio()
+        entry = {"chunks": [], "audio": None, "done": False, "cond": threading.Condition()}
+        with live["lock"]:
+            live["streams"][key] = entry
+
+        def pump():
+            try:
+                for chunk in audio_chunks:
+                    if chunk:
+                        with entry["cond"]:
+                            entry["chunks"].append(chunk)
+                            entry["cond"].notify_all()
+            except Exception:
+                pass  # Listeners get what arrived
+            finally:
+                with entry["cond"]:
+                    entry["audio"] = b''.join(entry["chunks"])
+                    entry["done"] = True
+                    entry["cond"].notify_all()
+                with live["lock"]:
+                    finished = [k for k, e in live["streams"].items() if e["done"]]
+                    for old_key in finished[:-LIVE_AUDIO_KEEP]:
+                        del live["streams"][old_key]
+
+        threading.Thread(target=pump, daemon=True).start()
+
+    return f"{base_url}/audio/{key}.mp3"
+
+def play_audio(audio, key=None):
+    """Render audio by sidecar URL when the browser can reach it, inline otherwise"""
+    st.audio(audio_url(audio, key) or audio, format='audio/mpeg')
+
+def play_audio_stream(audio_chunks, key):
+    """Render streamed audio, starting playback on the first chunk when the sidecar is reachable
+
+    st.audio cannot consume a stream, so without the sidecar the chunks are
+    collected first and playback only starts once synthesis has finished.
+    """
+    try:
+        url = live_audio_url(audio_chunks, key)
+        if url:
+            st.audio(url, format='audio/mpeg')
+            return
+
+        buffer = io.BytesIO()
+        for chunk in audio_chunks:
+            if chunk:
+                buffer.write(chunk)
+
+        audio = buffer.getvalue()
+        if audio:
+            play_audio(audio, key)
+    except Exception as e:
+        st.error(f"Audio streaming error: {str(e)}")
+        return None
+
+def _synthesize_to_cache(text, api_key, voice_id, model_id="eleven_monolingual_v1"):
+    """Synthesize text into the TTS cache without reporting errors to the page"""
     try:
-        url = "https://api.elevenlabs.io/v1/voices/add"
+        _fetch_speech(text, api_key, voice_id, model_id)
+    except Exception:
+        pass  # Speculative work; a failure only means a later cache miss
+
+@st.cache_resource(show_spinner=False)
+def warm_voice_previews(api_key, voice_ids):
+    """Pre-generate the preview clip of every voice into the TTS cache in the background"""
+    executor = ThreadPoolExecutor(max_workers=PREVIEW_MAX_WORKERS)
+    for voice_id in voice_ids:
+        executor.submit(_synthesize_to_cache, PREVIEW_TEXT, api_key, voice_id)
+    executor.shutdown(wait=False)
+    return executor
+
+@st.cache_resource
+def get_prefetcher():
+    """Start the background worker that fills the TTS cache with likely requests"""
+    prefetcher = {
+        "jobs": queue.Queue(maxsize=PREFETCH_QUEUE_SIZE),
+        "pending": set(),
+        "lock": threading.Lock()
+    }
+
+    def worker():
+        while True:
+            key, text, api_key, voice_id, model_id = prefetcher["jobs"].get()
+            try:
+                _synthesize_to_cache(text, api_key, voice_id, model_id)
+            finally:
+                with prefetcher["lock"]:
+                    prefetcher["pending"].discard(key)
+
+    threading.Thread(target=worker, daemon=True).start()
+    return prefetcher
+
+def prefetch_speech(prefetcher, text, api_key, voice_id, model_id="eleven_monolingual_v1"):
+    """Queue speculative synthesis into the TTS cache, dropping it when the queue is full"""
+    key = _tts_cache_key(text, voice_id, model_id)
+    if key in TTS_CACHE:
+        return
 
-        headers = {"xi-api-key": api_key}
+    with prefetcher["lock"]:
+        if key in prefetcher["pending"]:
+            return
+        try:
+            prefetcher["jobs"].put_nowait((key, text, api_key, voice_id, model_id))
+            prefetcher["pending"].add(key)
+        except queue.Full:
+            pass
+
+def prefetch_followups(conversation_history, api_key, voice_id):
+    """Prefetch speech for responses already cached in the context of the next turn
+
+    Entries are stored under the history that preceded their prompt, so the
+    answers given after this same history elsewhere are the likeliest next replies.
+    """
+    try:
+        prefetcher = get_prefetcher()
+        for response in semantic_cache_followups(conversation_history):
+            prefetch_speech(prefetcher, response, api_key, voice_id)
+    except Exception:
+        pass  # Speculative work; skip it when the semantic cache is unavailable
+
+async def _speak_sentences(sentences, audio_chunks, api_key, voice_id, model_id):
+    """Send sentences over the ElevenLabs input-streaming WebSocket and collect the audio"""
+    import websockets
+
+    uri = (
+        f"wss://api.elevenlabs.io/v1/text-to-speech/{voice_id}/stream-input"
+        f"?model_id={model_id}&output_format=mp3_44100_128"
+    )
 
-        files = []
+    try:
+        async with websockets.connect(uri) as ws:
+            await ws.send(orjson.dumps({
+                "text": " ",
+                "voice_settings": {
+                    "stability": 0.5,
+                    "similarity_boost": 0.75,
+                    "style": 0.0,
+                    "use_speaker_boost": True
+                },
+                "xi_api_key": api_key
+            }).decode())
+
+            async def send():
+                while True:
+                    # Sentences come from the Gemini worker thread
+                    sentence = await asyncio.to_thread(sentences.get)
+                    if sentence is None:
+                        await ws.send(orjson.dumps({"text": ""}).decode())
+                        break
+                    await ws.send(orjson.dumps({"text": sentence + " ", "try_trigger_generation": True}).decode())
+
+            async def receive():
+                buffer = io.BytesIO()
+                async for message in ws:
+                    data = orjson.loads(message)
+                    if data.get("audio"):
+                        chunk = base64.b64decode(data["audio"])
+                        buffer.write(chunk)
+                        audio_chunks.put(chunk)
+                    if data.get("isFinal"):
+                        break
+                return buffer.getvalue()
+
+            _, audio = await asyncio.gather(send(), receive())
+            return audio
+    finally:
+        audio_chunks.put(None)
+
+def stream_voice_response(model, prompt, conversation_history, api_key, voice_id,
+                          mode="conversational", model_id="eleven_monolingual_v1"):
+    """Stream a Gemini response as text while speaking it sentence by sentence
+
+    Returns a dict with the text token stream, an iterator of audio chunks as
+    they are synthesized, a future for the complete audio and the key the
+    audio is served under.
+    """
+    vec, cached_response = semantic_cache_lookup(prompt, mode, conversation_history)
+
+    if cached_response is not None:
+        audio_key = _tts_cache_key(cached_response, voice_id, model_id)
+        cached_audio = TTS_CACHE.get(audio_key)
+        if cached_audio is not None:
+            audio_future = Future()
+            audio_future.set_result(cached_audio)
+            return {
+                "tokens": iter([cached_response]),
+                "audio_chunks": iter([cached_audio]),
+                "audio": audio_future,
+                "audio_key": audio_key
+            }
+
+    # Resolve the context cache on the script thread, which owns the session state
+    if cached_response is None:
+        cached_request = cached_history_request(model, prompt, conversation_history, mode)
+        if cached_request:
+            gemini_model, contents = cached_request
+        else:
+            gemini_model, contents = model, build_gemini_prompt(prompt, conversation_history, mode)
+
+    tokens = queue.Queue()
+    sentences = queue.Queue()
+    audio_chunks = queue.Queue()
+    response_parts = []
+
+    def generate():
+        try:
+            if cached_response is not None:
+                texts = [cached_response]
+            else:
+                # The sync stream needs no event loop, so the cached model is safe to share
+                texts = (chunk.text for chunk in gemini_model.generate_content(contents, stream=True))
+
+            pending = ""
+            for text in texts:
+                tokens.put(text)
+                response_parts.append(text)
+                pending += text
+                *complete, pending = SENTENCE_BOUNDARY.split(pending)
+                for sentence in complete:
+                    sentences.put(sentence)
+            if pending.strip():
+                sentences.put(pending.strip())
+        finally:
+            sentences.put(None)
+            tokens.put(None)
+
+    def speak():
+        audio = asyncio.run(_speak_sentences(sentences, audio_chunks, api_key, voice_id, model_id))
+        # Keep the audio under the key of the text it speaks, so a later semantic
+        # cache hit on this response plays it without synthesizing again
+        text = cached_response if cached_response is not None else "".join(response_parts)
+        if audio and text and gemini_future.exception() is None:
+            TTS_CACHE.set(_tts_cache_key(text, voice_id, model_id), audio, expire=TTS_CACHE_EXPIRE)
+        return audio
+
+    executor = ThreadPoolExecutor(max_workers=2)
+    gemini_future = executor.submit(generate)
+    audio_future = executor.submit(speak)
+    executor.shutdown(wait=False)
+
+    def token_stream():
+        parts = []
+        while True:
+            token = tokens.get()
+            if token is None:
+                break
+            parts.append(token)
+            yield token
+
+        error = gemini_future.exception()
+        if error is not None:
+            st.error(f"Gemini AI error: {str(error)}")
+        elif cached_response is None and parts:
+            semantic_cache_store(vec, conversation_history, "".join(parts))
+
+    return {
+        "tokens": token_stream(),
+        "audio_chunks": iter(audio_chunks.get, None),
+        "audio": audio_future,
+        "audio_key": uuid.uuid4().hex
+    }
+
+def collect_voice_response(audio_future):
+    """Wait for the streamed voice response audio"""
+    try:
+        return audio_future.result()
+    except Exception as e:
+        st.error(f"Voice streaming error: {str(e)}")
+        return None
+
+def clone_voice(api_key, voice_name, audio_files, progress_callback=None):
+    """Clone a voice using ElevenLabs Voice Cloning"""
+    from requests_toolbelt.multipart.encoder import MultipartEncoder, MultipartEncoderMonitor
+
+    try:
+        fields = [
+            ('name', voice_name),
+            ('description', f'Cloned voice: {voice_name}')
+        ]
         for i, audio_file in enumerate(audio_files):
-            files.append(('files', (f'sample_{i}.mp3', audio_file, 'audio/mpeg')))
+            audio_file.seek(0)
+            fields.append(('files', (f'sample_{i}.mp3', audio_file, 'audio/mpeg')))
+
+        # Stream the samples from their file handles instead of copying them into memory
+        encoder = MultipartEncoder(fields=fields)
+        monitor = MultipartEncoderMonitor(
+            encoder,
+            lambda m: progress_callback(m.bytes_read / m.len) if progress_callback else None
+        )
 
-        data = {
-            'name': voice_name,
-            'description': f'Cloned voice: {voice_name}'
+        headers = {
+            "xi-api-key": api_key,
+            "Content-Type": monitor.content_type
         }
 
-        response = requests.post(url, headers=headers, files=files, data=data)
+        response = SESSION.post(VOICE_CLONE_URL, headers=headers, data=monitor)
 
         if response.status_code == 200:
-            return response.json()
+            return orjson.loads(response.content)
         else:
             st.error(f"Voice cloning error: {response.status_code} - {response.text}")
             return None
@@ -187,37 +1013,65 @@ def clone_voice(api_key, voice_name, audio_files):
 
 def elevenlabs_reader(text, api_key, voice_id):
     """ElevenReader functionality for reading long texts"""
+    import lameenc
+
     try:
         # Split text into chunks for better processing
         chunks = []
-        sentences = text.split('. ')
-        current_chunk = ""
-
-        for sentence in sentences:
-            if len(current_chunk + sentence) < 500:  # Keep chunks under 500 chars
-                current_chunk += sentence + ". "
+        parts = []
+        size = 0
+
+        for sentence in SENTENCE_BOUNDARY.split(text):
+            piece = sentence + " "
+            if size + len(piece) < 500:  # Keep chunks under 500 chars
+                parts.append(piece)
+                size += len(piece)
             else:
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-                current_chunk = sentence + ". "
-
-        if current_chunk:
-            chunks.append(current_chunk.strip())
-
-        # Generate audio for each chunk
-        audio_segments = []
+                if parts:
+                    chunks.append("".join(parts).strip())
+                parts = [piece]
+                size = len(piece)
+
+        if parts:
+            chunks.append("".join(parts).strip())
+
+        # Generate audio for all chunks concurrently, keeping chunk order.
+        # Pool threads cannot draw on the page, so errors are collected here.
+        audio_segments = [None] * len(chunks)
+        failures = []
         progress_bar = st.progress(0)
 
-        for i, chunk in enumerate(chunks):
-            audio = text_to_speech(chunk, api_key, voice_id, "eleven_multilingual_v2")
-            if audio:
-                audio_segments.append(audio)
-            progress_bar.progress((i + 1) / len(chunks))
+        with ThreadPoolExecutor(max_workers=READER_MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(
+                    _fetch_speech, chunk, api_key, voice_id, "eleven_multilingual_v2", READER_PCM_FORMAT
+                ): i
+                for i, chunk in enumerate(chunks)
+            }
+            for completed, future in enumerate(as_completed(futures), start=1):
+                try:
+                    audio_segments[futures[future]] = future.result()
+                except Exception as e:
+                    failures.append((futures[future], e))
+                progress_bar.progress(completed / len(chunks))
+
+        if failures:
+            index, error = min(failures, key=lambda failure: failure[0])
+            st.error(
+                f"ElevenReader error: {len(failures)} of {len(chunks)} passages could not be "
+                f"synthesized (first at passage {index + 1}: {error})"
+            )
+            return None
 
-        # Combine audio segments (simple concatenation)
+        # Concatenate the raw PCM and encode it to MP3 once for the whole document
         if audio_segments:
-            combined_audio = b''.join(audio_segments)
-            return combined_audio
+            encoder = lameenc.Encoder()
+            encoder.set_bit_rate(128)
+            encoder.set_in_sample_rate(READER_SAMPLE_RATE)
+            encoder.set_channels(1)
+            encoder.set_quality(2)
+            combined_audio = encoder.encode(b''.join(audio_segments)) + encoder.flush()
+            return bytes(combined_audio)
 
         return None
 
@@ -225,6 +1079,10 @@ def elevenlabs_reader(text, api_key, voice_id):
         st.error(f"ElevenReader error: {str(e)}")
         return None
 
+def count_words(text):
+    """Count the words of a text without splitting it into a list"""
+    return sum(1 for _ in WORD.finditer(text))
+
 def main():
     st.title("🎤 IIElevenLabs Remake")
     # st.markdown("### Complete Voice AI Suite powered by **Gemini 2.0 Flash** ⚡")
@@ -239,6 +1097,7 @@ def main():
     # Get available voices
     if elevenlabs_api_key:
         available_voices = get_available_voices(elevenlabs_api_key)
+        warm_voice_previews(elevenlabs_api_key, tuple(available_voices.values()))
     else:
         available_voices = {}
 
@@ -251,7 +1110,7 @@ def main():
     tab1, tab2, tab3, tab4 = st.tabs(["🗣️ Conversational AI", "🎬 Dubbing", "👥 Voice Cloning", "📖 ElevenReader"])
 
     with tab1:
-        st.header("🗣️ Conversational AI - Powered by Gemini 2.0 Flash")
+        st.header("🗣️ Conversational AI - Powered by Gemini 2.5 Flash")
         st.markdown("*Experience enhanced reasoning, multimodal understanding, and superior context awareness*")
 
         col1, col2 = st.columns([2, 1])
@@ -281,15 +1140,16 @@ def main():
         with col2:
             if st.button("🔊 Preview Voice") and available_voices:
                 preview_audio = text_to_speech(
-                    "Hello! This is how I sound. How can I help you today?",
+                    PREVIEW_TEXT,
                     elevenlabs_api_key,
                     voice_id
                 )
                 if preview_audio:
-                    st.audio(preview_audio, format='audio/mpeg')
+                    play_audio(preview_audio, _tts_cache_key(PREVIEW_TEXT, voice_id, "eleven_monolingual_v1"))
 
             if st.button("🗑️ Clear History"):
                 st.session_state.conversation_history = []
+                clear_gemini_cache()
                 st.rerun()
 
         # Process conversational input
@@ -305,12 +1165,23 @@ def main():
                 user_input = text_input.strip()
 
             if user_input:
-                with st.spinner("🤖 Thinking..."):
-                    ai_response = get_gemini_response(
-                        gemini_model, user_input,
-                        st.session_state.conversation_history,
-                        "conversational"
-                    )
+                voice_response = stream_voice_response(
+                    gemini_model, user_input,
+                    st.session_state.conversation_history,
+                    elevenlabs_api_key, voice_id,
+                    "conversational"
+                )
+
+                # Play the first synthesized sentence while later tokens still stream in
+                live_url = live_audio_url(voice_response["audio_chunks"], voice_response["audio_key"])
+                if live_url:
+                    st.audio(live_url, format='audio/mpeg', autoplay=True)
+
+                st.markdown("**AI Response:**")
+                ai_response = st.write_stream(voice_response["tokens"])
+
+                with st.spinner("🔊 Generating voice response..."):
+                    audio_response = collect_voice_response(voice_response["audio"])
 
                 if ai_response:
                     st.session_state.conversation_history.append({
@@ -318,14 +1189,18 @@ def main():
                         'ai': ai_response
                     })
 
-                    with st.spinner("🔊 Generating voice response..."):
-                        audio_response = text_to_speech(ai_response, elevenlabs_api_key, voice_id)
+                    # Speculatively synthesize likely follow-up responses
+                    prefetch_followups(
+                        st.session_state.conversation_history,
+                        elevenlabs_api_key, voice_id
+                    )
 
                     st.success("✅ Response generated!")
-                    st.markdown(f"**AI Response:** {ai_response}")
 
                     if audio_response:
-                        st.audio(audio_response, format='audio/mpeg')
+                        st.session_state.audio_response = audio_response
+                        if not live_url:
+                            play_audio(audio_response, voice_response["audio_key"])
 
         # Conversation History
         if st.session_state.conversation_history:
@@ -362,11 +1237,14 @@ def main():
                         )
 
                         # Generate audio with custom settings
-                        dubbing_audio = text_to_speech(dubbing_script, elevenlabs_api_key, dubbing_voice_id)
+                        dubbing_stream = stream_text_to_speech(dubbing_script, elevenlabs_api_key, dubbing_voice_id)
 
-                        if dubbing_audio:
+                        if dubbing_stream:
                             st.success("🎬 Dubbing generated!")
-                            st.audio(dubbing_audio, format='audio/mpeg')
+                            play_audio_stream(
+                                dubbing_stream,
+                                _tts_cache_key(dubbing_script, dubbing_voice_id, "eleven_monolingual_v1")
+                            )
 
                             if dubbing_advice:
                                 st.subheader("🎭 Dubbing Direction")
@@ -403,11 +1281,11 @@ def main():
             if st.button("🧬 Clone Voice", type="primary"):
                 if voice_name and uploaded_files:
                     with st.spinner("Cloning voice... This may take a few minutes."):
-                        audio_files = []
-                        for file in uploaded_files:
-                            audio_files.append(file.getvalue())
-
-                        result = clone_voice(elevenlabs_api_key, voice_name, audio_files)
+                        upload_progress = st.progress(0)
+                        result = clone_voice(
+                            elevenlabs_api_key, voice_name, uploaded_files,
+                            lambda fraction: upload_progress.progress(min(fraction, 1.0))
+                        )
 
                         if result:
                             st.success(f"✅ Voice '{voice_name}' cloned successfully!")
@@ -476,26 +1354,25 @@ def main():
 
                         if reader_audio:
                             st.session_state.reader_audio = reader_audio
+                            # Hash the reading once here rather than on every rerun that plays it
+                            st.session_state.reader_audio_key = hashlib.sha256(reader_audio).hexdigest()
                             st.success("📖 Reading generated successfully!")
 
-                            # Get reading suggestions from Gemini
-                            reading_tips = get_gemini_response(
-                                gemini_model,
-                                f"Provide reading tips and summary for this text: {text_to_read[:500]}...",
-                                [],
-                                "reader"
-                            )
+                            # Get summary and reading suggestions from Gemini
+                            reading_analysis = get_reading_analysis(gemini_model, text_to_read[:500])
 
-                            if reading_tips:
+                            if reading_analysis:
                                 st.subheader("📚 Reading Analysis")
-                                st.markdown(reading_tips)
+                                if reading_analysis.get("summary"):
+                                    st.markdown(f"**Summary:** {reading_analysis['summary']}")
+                                st.markdown(reading_analysis.get("tips", ""))
                 else:
                     st.error("Please provide text to read.")
 
             # Play generated reading
             if st.session_state.reader_audio:
                 st.subheader("🔊 Generated Reading")
-                st.audio(st.session_state.reader_audio, format='audio/mpeg')
+                play_audio(st.session_state.reader_audio, st.session_state.reader_audio_key)
 
         with col2:
             st.subheader("ElevenReader Features")
@@ -517,7 +1394,7 @@ def main():
 
             # Word count and estimated reading time
             if text_to_read:
-                word_count = len(text_to_read.split())
+                word_count = count_words(text_to_read)
                 estimated_time = word_count / 150  # Average reading speed
                 st.metric("Word Count", word_count)
                 st.metric("Estimated Reading Time", f"{estimated_time:.1f} minutes")